@@ -4,13 +4,16 @@ FastAPI backend for The Recovery Roadmap web interface.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List
 import os
 from recovery_roadmap import RecoveryRoadmapCalculator, SimulationConfig, TradeResult
 
 
-app = FastAPI(title="The Recovery Roadmap API")
+# orjson encodes the response in C, skipping the default json.dumps path
+app = FastAPI(title="The Recovery Roadmap API", default_response_class=ORJSONResponse)
 
 # Get allowed origins from environment variable (required)
 allowed_origins_str = os.getenv("ALLOWED_ORIGINS", "")
@@ -20,7 +23,9 @@ if not allowed_origins_str:
         "Set it to a comma-separated list of allowed origins (e.g., https://example.com,http://localhost:3000)"
     )
 
-allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",") if origin.strip()]
+# frozenset gives O(1) membership checks in CORSMiddleware's origin
+# matching instead of a linear scan per preflight
+allowed_origins = frozenset(origin.strip() for origin in allowed_origins_str.split(",") if origin.strip())
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -54,49 +59,118 @@ class SimulationResponse(BaseModel):
     summary: dict
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {"message": "The Recovery Roadmap API"}
+# Prebuilt validator for the whole trade list: the schema is compiled once
+# at import, and validate_python makes a single C-level pass over the batch
+# instead of N separate TradeResponse constructions.
+_TRADES_ADAPTER = TypeAdapter(List[TradeResponse])
 
 
-@app.post("/api/simulate", response_model=SimulationResponse)
-async def simulate(request: SimulationRequest):
-    """
-    Run the recovery roadmap simulation.
-    
-    Returns:
-        SimulationResponse with trades and summary
-    """
+# Responses with more trades than this are streamed instead of buffered
+STREAM_THRESHOLD = 1000
+
+
+def _build_config(request: SimulationRequest) -> SimulationConfig:
+    """Validate the request and build the simulation config."""
     # Validate that target is greater than current balance
     if request.target_balance <= request.current_balance:
         raise ValueError("Target balance must be greater than current balance")
-    
-    # Create configuration
-    config = SimulationConfig(
+
+    return SimulationConfig(
         current_balance=request.current_balance,
         target_balance=request.target_balance,
         risk_per_trade_percent=request.risk_per_trade_percent,
         risk_reward_ratio=request.risk_reward_ratio
     )
-    
-    # Run calculation
-    calculator = RecoveryRoadmapCalculator(config)
-    trades = calculator.calculate()
+
+
+def run_simulation(request: SimulationRequest) -> dict:
+    """
+    Run the simulation for a validated request and build the response dict.
+
+    Single source for the request -> config -> response pipeline so every
+    consumer (endpoint, warmup, future batch callers) goes through the
+    same path.
+
+    Returns:
+        Dict with trades and summary (see SimulationResponse)
+    """
+    # trade_rows() returns plain dicts straight from the kernel arrays,
+    # so no per-trade Pydantic models are constructed.
+    calculator = RecoveryRoadmapCalculator(_build_config(request))
+    trades = calculator.trade_rows()
     summary = calculator.get_summary()
-    
-    # Convert trades to response format
-    trade_responses = [
-        TradeResponse(
-            trade_number=trade.trade_number,
-            account_balance=trade.account_balance,
-            risk_amount=trade.risk_amount,
-            profit_amount=trade.profit_amount
-        )
-        for trade in trades
-    ]
-    
-    return SimulationResponse(trades=trade_responses, summary=summary)
+
+    _TRADES_ADAPTER.validate_python(trades)
+    return {"trades": trades, "summary": summary}
+
+
+def _stream_simulation(rows, summary) -> StreamingResponse:
+    """
+    Stream the response JSON incrementally for large runs.
+
+    Emits the same wire format as the buffered path, but rows are
+    serialized and flushed as they are produced, so the first bytes go
+    out before the full payload exists and the per-row Python objects
+    (dicts, boxed floats, JSON fragments) stay bounded by the iterator's
+    chunk size. The float64 kernel arrays themselves still scale with
+    the trade count.
+    """
+    def body():
+        yield b'{"trades":['
+        first = True
+        for row in rows:
+            if first:
+                first = False
+            else:
+                yield b","
+            yield orjson.dumps(row)
+        yield b'],"summary":' + orjson.dumps(summary) + b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+@app.on_event("startup")
+async def warmup():
+    """
+    Pre-compile and pre-cache on boot.
+
+    When the Cython kernel is not built, the first simulation pays the
+    Numba JIT compile cost; running one here moves that off the first
+    request. Also warms the result cache for the default parameters.
+    """
+    run_simulation(SimulationRequest())
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return {"message": "The Recovery Roadmap API"}
+
+
+@app.post("/api/simulate")
+def simulate(request: SimulationRequest):
+    """
+    Run the recovery roadmap simulation.
+
+    Declared sync (not async) on purpose: the simulation is pure CPU
+    work, so Starlette dispatches it to its threadpool instead of
+    blocking the event loop for the whole request. Runs above
+    STREAM_THRESHOLD trades are streamed row by row.
+
+    Returns:
+        Dict with trades and summary (see SimulationResponse)
+    """
+    calculator = RecoveryRoadmapCalculator(_build_config(request))
+
+    # The closed-form summary is O(1), so sizing the response to pick a
+    # path costs nothing.
+    if calculator.calculate_summary_only()["total_trades"] > STREAM_THRESHOLD:
+        # Skipping batch validation here: it would force materializing
+        # every row up front and defeat the point of streaming.
+        rows = calculator.iter_trade_rows()
+        return _stream_simulation(rows, calculator.get_summary())
+
+    return run_simulation(request)
 
 
 if __name__ == "__main__":
@@ -104,4 +178,15 @@ if __name__ == "__main__":
     # PORT is typically set by the platform (Railway, Heroku, etc.)
     # Default to 8000 only for local development
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop and httptools ship with uvicorn[standard]; requesting them
+    # explicitly avoids silently falling back to the slower asyncio loop.
+    # The app is passed as an import string so workers > 1 is supported.
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level="warning",
+    )
@@ -6,7 +6,6 @@ Run this script to calculate the recovery roadmap from the command line.
 """
 
 import argparse
-from tabulate import tabulate
 from recovery_roadmap import RecoveryRoadmapCalculator, SimulationConfig
 
 
@@ -15,6 +14,35 @@ def format_currency(amount: float) -> str:
     return f"${amount:,.2f}"
 
 
+def render_table(trades) -> str:
+    """
+    Render the trade table in a single formatting pass.
+
+    Column widths come from the last trade only: balances, risks and
+    profits all grow monotonically, so its formatted fields are the
+    widest. This avoids tabulate's separate width-measuring pass and
+    per-cell padding for large runs.
+    """
+    fmt = "${:,.2f}".format
+    last = trades[-1]
+    headers = ("Trade #", "Account Balance", "Risk Amount ($)", "Profit Amount ($)")
+    w1 = max(len(headers[0]), len(str(last.trade_number)))
+    w2 = max(len(headers[1]), len(fmt(last.account_balance)))
+    w3 = max(len(headers[2]), len(fmt(last.risk_amount)))
+    w4 = max(len(headers[3]), len(fmt(last.profit_amount)))
+
+    lines = [
+        f"{headers[0]:>{w1}}  {headers[1]:>{w2}}  {headers[2]:>{w3}}  {headers[3]:>{w4}}",
+        "-" * (w1 + w2 + w3 + w4 + 6)
+    ]
+    lines.extend(
+        f"{t.trade_number:>{w1}}  {fmt(t.account_balance):>{w2}}  "
+        f"{fmt(t.risk_amount):>{w3}}  {fmt(t.profit_amount):>{w4}}"
+        for t in trades
+    )
+    return "\n".join(lines)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -81,16 +109,6 @@ def main():
     trades = calculator.calculate()
     summary = calculator.get_summary()
     
-    # Prepare table data
-    table_data = []
-    for trade in trades:
-        table_data.append([
-            trade.trade_number,
-            format_currency(trade.account_balance),
-            format_currency(trade.risk_amount),
-            format_currency(trade.profit_amount)
-        ])
-    
     # Display results
     print("\n" + "="*70)
     print("THE RECOVERY ROADMAP - Perfect Execution Simulation")
@@ -104,9 +122,8 @@ def main():
     print("TRADE SIMULATION RESULTS")
     print("-"*70)
     
-    if table_data:
-        headers = ["Trade #", "Account Balance", "Risk Amount ($)", "Profit Amount ($)"]
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+    if trades:
+        print(render_table(trades))
     else:
         print("No trades needed - target already reached!")
     
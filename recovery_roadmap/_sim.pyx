@@ -0,0 +1,34 @@
+# cython: language_level=3
+"""
+Cython implementation of the perfect-execution simulation kernel.
+
+Ahead-of-time compiled alternative to the Numba kernel in core.py:
+same tight scalar loop, but no first-call JIT latency. Build with
+`python setup.py build_ext --inplace`; core.py falls back to the
+Numba/NumPy kernels when this module is not compiled.
+"""
+
+import numpy as np
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple simulate(double current_balance, Py_ssize_t n, double rpc, double rr):
+    """Run the simulation kernel for n trades; returns (balances, risks, profits)."""
+    cdef double g = 1.0 + rpc * rr
+    balances_arr = np.empty(n)
+    risks_arr = np.empty(n)
+    profits_arr = np.empty(n)
+    cdef double[::1] balances = balances_arr
+    cdef double[::1] risks = risks_arr
+    cdef double[::1] profits = profits_arr
+    cdef double balance = current_balance
+    cdef Py_ssize_t i
+    for i in range(n):
+        balances[i] = balance
+        risks[i] = balance * rpc
+        profits[i] = balance * rpc * rr
+        balance *= g
+    return balances_arr, risks_arr, profits_arr
@@ -5,11 +5,125 @@ This module contains the logic for simulating account growth
 using a fixed Risk-Reward trading strategy.
 """
 
+import math
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Optional
 
+import numpy as np
 
-@dataclass
+try:
+    from . import _sim  # AOT-compiled Cython kernel (setup.py build_ext)
+except ImportError:  # optional accelerator
+    _sim = None
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator
+    njit = None
+
+
+def _simulate(current_balance: float, n: int, rpc: float, rr: float):
+    """
+    Run the perfect-execution simulation kernel for n trades.
+
+    Returns the per-trade (balances, risks, profits) arrays. The tight
+    scalar loop keeps the running balance in a register and avoids the
+    repeated np.power evaluation. Replaced below by the Cython build
+    when compiled, or by a Numba-jitted version when available.
+    """
+    g = 1.0 + rpc * rr
+    balances = np.empty(n)
+    risks = np.empty(n)
+    profits = np.empty(n)
+    balance = current_balance
+    for i in range(n):
+        balances[i] = balance
+        risks[i] = balance * rpc
+        profits[i] = balance * rpc * rr
+        balance *= g
+    return balances, risks, profits
+
+
+if _sim is not None:
+    _simulate = _sim.simulate
+elif njit is not None:
+    _simulate = njit(cache=True, fastmath=True)(_simulate)
+else:
+    def _simulate(current_balance: float, n: int, rpc: float, rr: float):  # noqa: F811
+        """Vectorized NumPy fallback used when neither kernel is compiled."""
+        g = 1.0 + rpc * rr
+        balances = current_balance * np.power(g, np.arange(n))
+        risks = balances * rpc
+        profits = risks * rr
+        return balances, risks, profits
+
+
+@lru_cache(maxsize=128)
+def _inv_log2(g: float) -> float:
+    """Reciprocal of log2(g), cached since risk settings repeat across requests."""
+    return 1.0 / math.log2(g)
+
+
+def _exp2_or_inf(exponent: float) -> float:
+    """2 ** exponent, degrading to inf instead of raising on overflow."""
+    try:
+        return math.exp2(exponent)
+    except OverflowError:
+        return math.inf
+
+
+def _trade_count(current_balance: float, target_balance: float, g: float) -> int:
+    """
+    Number of trades needed to reach the target balance.
+
+    Each winning trade multiplies the balance by the constant growth
+    factor g, so the trade count is the closed form
+    ceil(log2(target / current) / log2(g)) instead of an iterated loop.
+    The division is folded into a cached reciprocal, so repeat risk
+    settings cost one log2 and one multiply.
+
+    Returns:
+        Number of trades needed (0 if the target is already reached)
+    """
+    if current_balance >= target_balance:
+        return 0
+
+    # Subtract logs rather than dividing first: target / current can
+    # overflow float64 to inf for extreme inputs even though both
+    # balances (and the trade count) are perfectly representable.
+    log2_current = math.log2(current_balance)
+    inv_log2_g = _inv_log2(g)
+    n = math.ceil((math.log2(target_balance) - log2_current) * inv_log2_g)
+
+    # Guard against floating-point drift at the boundary so the count
+    # matches iterated-growth semantics exactly. Only run the checks
+    # while g ** (n + 1) (and the resulting balance) stay within float64
+    # range; for more extreme ratios the closed-form count is used as-is,
+    # where a one-trade drift is immaterial anyway.
+    if n + 1 < (1023.0 - max(log2_current, 0.0)) * inv_log2_g:
+        while current_balance * g ** n < target_balance:
+            n += 1
+        while n > 0 and current_balance * g ** (n - 1) >= target_balance:
+            n -= 1
+
+    return n
+
+
+@lru_cache(maxsize=1024)
+def _cached_simulate(current_balance: float, target_balance: float, rpc: float, rr: float):
+    """
+    Memoized entry point to the simulation kernel.
+
+    Keyed on the four config floats; repeat runs with identical
+    parameters (web clients refreshing or sharing links) become a single
+    dict lookup instead of a full recomputation.
+    """
+    n = _trade_count(current_balance, target_balance, 1.0 + rpc * rr)
+    return _simulate(current_balance, n, rpc, rr)
+
+
+@dataclass(slots=True, frozen=True)
 class TradeResult:
     """Represents a single trade result."""
     trade_number: int
@@ -18,7 +132,7 @@ class TradeResult:
     profit_amount: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimulationConfig:
     """Configuration for the recovery roadmap simulation."""
     current_balance: float
@@ -27,68 +141,173 @@ class SimulationConfig:
     risk_reward_ratio: float  # e.g., 3.0 means 1:3
 
 
+# Rows per tolist() slice when iterating trades lazily; bounds the number
+# of boxed Python floats alive at once during streaming
+_ROW_CHUNK = 4096
+
+
 class RecoveryRoadmapCalculator:
     """Calculates the recovery roadmap using perfect execution simulation."""
-    
+
+    __slots__ = ("config", "trades", "_balances", "_risks", "_profits")
+
     def __init__(self, config: SimulationConfig):
         self.config = config
         self.trades: List[TradeResult] = []
-    
+        self._balances: Optional[np.ndarray] = None
+        self._risks: Optional[np.ndarray] = None
+        self._profits: Optional[np.ndarray] = None
+
     def calculate(self) -> List[TradeResult]:
         """
         Simulate perfect execution trades until target balance is reached.
-        
+
+        The heavy lifting happens in the _simulate kernel, which runs over
+        the known trade count rather than one interpreted iteration per
+        trade.
+
         Returns:
             List of TradeResult objects representing each trade
         """
-        self.trades = []
-        current_balance = self.config.current_balance
-        trade_number = 1
-        
-        while current_balance < self.config.target_balance:
-            # Calculate risk amount based on current balance
-            risk_amount = current_balance * (self.config.risk_per_trade_percent / 100)
-            
-            # Calculate profit amount based on risk-reward ratio
-            profit_amount = risk_amount * self.config.risk_reward_ratio
-            
-            # Add profit to balance (assuming win)
-            new_balance = current_balance + profit_amount
-            
-            # Create trade result
-            trade = TradeResult(
-                trade_number=trade_number,
-                account_balance=current_balance,
-                risk_amount=risk_amount,
-                profit_amount=profit_amount
+        self._balances, self._risks, self._profits = _cached_simulate(
+            self.config.current_balance,
+            self.config.target_balance,
+            self.config.risk_per_trade_percent / 100,
+            self.config.risk_reward_ratio
+        )
+
+        # Hoist the class lookup and use positional construction: the
+        # comprehension is the one remaining Python-level loop, so the
+        # per-trade LOAD_GLOBAL and keyword handling add up for large runs.
+        trade_result = TradeResult
+        self.trades = [
+            trade_result(i, balance, risk, profit)
+            for i, (balance, risk, profit) in enumerate(
+                zip(self._balances.tolist(), self._risks.tolist(), self._profits.tolist()),
+                start=1
             )
-            self.trades.append(trade)
-            
-            # Update for next iteration
-            current_balance = new_balance
-            trade_number += 1
-        
+        ]
+
         return self.trades
-    
-    def get_summary(self) -> dict:
+
+    def trade_rows(self) -> List[dict]:
         """
-        Generate summary statistics from the simulation.
-        
+        Per-trade results as plain dicts, ready for serialization.
+
+        Skips TradeResult construction entirely: the kernel arrays are
+        converted once in C via tolist() and zipped into dicts.
+
+        Returns:
+            List of dicts with the same fields as TradeResult
+        """
+        return list(self.iter_trade_rows())
+
+    def iter_trade_rows(self) -> Iterator[dict]:
+        """
+        Lazily yield per-trade dicts for streaming consumers.
+
+        The kernel runs eagerly (so get_summary works immediately), but
+        row dicts are produced one at a time instead of all at once.
+
+        Returns:
+            Iterator of dicts with the same fields as TradeResult
+        """
+        self._balances, self._risks, self._profits = _cached_simulate(
+            self.config.current_balance,
+            self.config.target_balance,
+            self.config.risk_per_trade_percent / 100,
+            self.config.risk_reward_ratio
+        )
+        return self._iter_rows()
+
+    def _iter_rows(self) -> Iterator[dict]:
+        # Convert the arrays in fixed-size slices so streaming consumers
+        # never hold more than one chunk of boxed Python floats; a single
+        # whole-array tolist() would keep three N-element lists alive for
+        # the entire stream.
+        total = len(self._balances)
+        for start in range(0, total, _ROW_CHUNK):
+            stop = start + _ROW_CHUNK
+            for i, (balance, risk, profit) in enumerate(
+                zip(
+                    self._balances[start:stop].tolist(),
+                    self._risks[start:stop].tolist(),
+                    self._profits[start:stop].tolist()
+                ),
+                start=start + 1
+            ):
+                yield {
+                    "trade_number": i,
+                    "account_balance": balance,
+                    "risk_amount": risk,
+                    "profit_amount": profit
+                }
+
+    def calculate_summary_only(self) -> dict:
+        """
+        Summary statistics from the closed form, without per-trade data.
+
+        The balance before trade i is current * g**i, so the final
+        balance and maximum risk follow directly from the trade count —
+        no arrays or TradeResult lists are allocated.
+
         Returns:
             Dictionary with summary statistics
         """
-        if not self.trades:
+        current = self.config.current_balance
+        rpc = self.config.risk_per_trade_percent / 100
+        g = 1.0 + rpc * self.config.risk_reward_ratio
+        n = _trade_count(current, self.config.target_balance, g)
+
+        if n == 0:
             return {
                 "total_trades": 0,
                 "max_risk_taken": 0.0,
-                "final_balance": self.config.current_balance
+                "final_balance": current
             }
-        
-        max_risk = max(trade.risk_amount for trade in self.trades)
-        final_balance = self.trades[-1].account_balance + self.trades[-1].profit_amount
-        
+
+        # Same overflow discipline as _trade_count: exponentiate directly
+        # only while g ** n (and the resulting balance) stay within
+        # float64 range. Beyond that, assemble the values in log space,
+        # degrading to inf exactly like iterated growth would.
+        log2_g = math.log2(g)
+        log2_current = math.log2(current)
+        if n * log2_g + max(log2_current, 0.0) < 1023.0:
+            max_risk = current * g ** (n - 1) * rpc
+            final_balance = current * g ** n
+        else:
+            max_risk = _exp2_or_inf(log2_current + (n - 1) * log2_g + math.log2(rpc))
+            final_balance = _exp2_or_inf(log2_current + n * log2_g)
+
+        return {
+            "total_trades": n,
+            "max_risk_taken": max_risk,
+            "final_balance": final_balance,
+            "starting_balance": current,
+            "target_balance": self.config.target_balance
+        }
+
+    def get_summary(self) -> dict:
+        """
+        Generate summary statistics from the simulation.
+
+        Falls back to the closed form when per-trade data has not been
+        materialized, so summary-only callers never pay for it.
+
+        Returns:
+            Dictionary with summary statistics
+        """
+        if self._balances is None or len(self._balances) == 0:
+            return self.calculate_summary_only()
+
+        # Balances grow geometrically and risk is a fixed fraction of
+        # balance, so risks are strictly increasing: the last trade always
+        # carries the maximum risk. No need to scan the array.
+        max_risk = float(self._risks[-1])
+        final_balance = float(self._balances[-1] + self._profits[-1])
+
         return {
-            "total_trades": len(self.trades),
+            "total_trades": len(self._balances),
             "max_risk_taken": max_risk,
             "final_balance": final_balance,
             "starting_balance": self.config.current_balance,
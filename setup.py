@@ -0,0 +1,16 @@
+"""
+Build script for the optional Cython simulation kernel.
+
+Run `python setup.py build_ext --inplace` to compile
+recovery_roadmap/_sim.pyx; the package works without it via the
+Numba/NumPy kernels in recovery_roadmap/core.py.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="recovery-roadmap",
+    packages=["recovery_roadmap"],
+    ext_modules=cythonize("recovery_roadmap/_sim.pyx", language_level=3),
+)